@@ -161,6 +161,16 @@ class SerialConnection(AbstractConnection):
         "rtscts": False,
         "dsrdtr": False,
         "inter_byte_timeout": False,
+        # Ask the serial driver for low latency mode (Linux only). For FTDI
+        # USB-serial adapters this drops the latency timer from 16 ms to 1 ms.
+        "low_latency": False,
+        # Size of the serial driver receive/transmit buffers in bytes (Windows only).
+        # None leaves the driver defaults.
+        "driver_buffer_size": None,
+        # Time in seconds to wait for more data once the serial port input
+        # buffer runs empty, so that the replies delivered in several chunks
+        # are passed to the upper level at once. 0 - don't wait.
+        "receive_settle_time": 0,
     }  # type: ConnectionParameters
 
     def __init__(self, connection_parameters: ConnectionParameters):
@@ -177,6 +187,8 @@ class SerialConnection(AbstractConnection):
         # This is the time that connection listener sleeps between serial port read attempts
         # So this determines the maximum delay between reply received and reply being read out.
         self.receiving_interval = self.connection_parameters.get("receiving_interval")
+        # Time to wait for the rest of the reply after the input buffer runs empty
+        self.receive_settle_time = self.connection_parameters.get("receive_settle_time")
 
         # Connection listener thread settings
         self.listener = None
@@ -187,9 +199,16 @@ class SerialConnection(AbstractConnection):
         """Creates, sets up and opens serial connection.
         """
 
+        # Keep the port that is already open together with its driver settings
+        # TODO add the same check for TCPIP
+        if self.is_connection_open() and self.listener.is_alive():  # type: ignore
+            self.logger.info("Port %s is already open.", self._connection.port)
+            return
+        if self.is_connection_open():
+            # Listener died - reopen the port from scratch
+            self._connection.close()
         # Create serial connection object
         # port=None is required to prevent port from being immediately opened
-        # TODO add here & for TCPIP check is connection already open
         self._connection = serial.Serial(port=None)
         self._clear_data_buffer()
         # Load settings
@@ -209,12 +228,37 @@ class SerialConnection(AbstractConnection):
             self._connection.open()
         except serial.SerialException as e:
             raise PLConnectionError(f"Can't open serial port {self._connection.port}!") from e
+        self._tune_driver()
         # Start connection listener
         self.listener = threading.Thread(target=self.connection_listener, name="{}_listener".format(__name__), daemon=True)
         self._connection_close_requested.clear()
         self.listener.start()
         self.logger.info("Port %s opened.", self._connection.port)
 
+    def _tune_driver(self):
+        """Applies optional serial driver settings that are not supported on
+        every platform. Failure to apply them is not critical, so it is only
+        logged.
+        """
+
+        if self.connection_parameters.get("low_latency"):
+            try:
+                self._connection.set_low_latency_mode(True)
+                self.logger.info("Low latency mode enabled for port %s.", self._connection.port)
+            except AttributeError:
+                self.logger.debug("_tune_driver()::low latency mode not supported on this platform - skipped.")
+            except (NotImplementedError, ValueError, OSError):
+                self.logger.warning("Can't enable low latency mode for port %s!", self._connection.port)
+        buffer_size = self.connection_parameters.get("driver_buffer_size")
+        if buffer_size is not None:
+            try:
+                self._connection.set_buffer_size(rx_size=buffer_size, tx_size=buffer_size)
+                self.logger.info("Driver buffer size for port %s set to %s bytes.", self._connection.port, buffer_size)
+            except AttributeError:
+                self.logger.debug("_tune_driver()::setting driver buffer size not supported on this platform - skipped.")
+            except (ValueError, OSError):
+                self.logger.warning("Can't set driver buffer size for port %s!", self._connection.port)
+
     def connection_listener(self):
         """Periodically checks for new data on the connection,
         reads it, puts the data read into receive buffer and raises data ready flag.
@@ -230,22 +274,33 @@ class SerialConnection(AbstractConnection):
                 # If the flag is still set it means receive() hasn't yet read it out
                 if self._data_ready.is_set() is True:
                     self.logger.warning("Discarding unconsumed device reply <%r>", self._last_reply)
-                self._last_reply = ""
-                # Read data from connection into buffer
-                while self._connection.in_waiting > 0 and len(self._last_reply) <= self.receive_buffer_size:
-                    self.logger.debug("connection_listener()::<%s> bytes to read", self._connection.in_waiting)
+                # Read all data available from connection into buffer
+                reply_bytes = bytearray()
+                while len(reply_bytes) <= self.receive_buffer_size:
+                    bytes_waiting = self._connection.in_waiting
+                    if bytes_waiting == 0:
+                        # USB-serial adapters often deliver a reply in several small
+                        # chunks - give the rest of it a chance to arrive
+                        if not self.receive_settle_time:
+                            break
+                        sleep(self.receive_settle_time)
+                        if self._connection.in_waiting == 0:
+                            break
+                        continue
+                    self.logger.debug("connection_listener()::<%s> bytes to read", bytes_waiting)
                     # Lock connection
                     with self._connection_lock:
-                        reply_bytes = self._connection.read(size=self.receive_buffer_size)
-                        self.logger.debug("connection_listener()::got reply <%s>", reply_bytes)
-                    try:
-                        self._last_reply += reply_bytes.decode(self.encoding)
-                    except UnicodeDecodeError:
-                        self.logger.exception("Can't decode device reply!", exc_info=True)
-                        # Unlock connection & break to outer loop discarding current data
-                        break
-                # Notify main thread that it can access _last_reply now
-                self._data_ready.set()
+                        reply_bytes += self._connection.read(size=min(bytes_waiting, self.receive_buffer_size))
+                self.logger.debug("connection_listener()::got reply <%s>", reply_bytes)
+                try:
+                    self._last_reply = reply_bytes.decode(self.encoding)
+                except UnicodeDecodeError:
+                    self.logger.exception("Can't decode device reply!", exc_info=True)
+                    # Discard current data
+                    self._last_reply = ""
+                else:
+                    # Notify main thread that it can access _last_reply now
+                    self._data_ready.set()
             # Switch thread context to main
             sleep(self.receiving_interval)
 
@@ -1,12 +1,14 @@
 """PyLabware device controllers."""
 
+import asyncio
 import copy
 import logging
 import threading
 from abc import abstractmethod, ABC
+from concurrent.futures import Future
 from functools import wraps
 import queue
-from time import sleep
+from time import monotonic, sleep
 from typing import Optional, Union, Callable, Any, List, Dict, Tuple
 
 from .connections import (HTTPConnection, SerialConnection, TCPIPConnection)
@@ -76,6 +78,30 @@ def in_simulation_device_returns(value):
     return wrapper
 
 
+def cached_reply(ttl: Optional[float] = None):
+    """ Decorator that caches the value returned by the device method
+    separately for every set of arguments. The cached value expires after ttl
+    seconds, or, if no ttl is given, is kept until
+    :py:meth:`LabDevice.clear_cache()` is called.
+    """
+    def wrapper(func):
+        @wraps(func)
+        def wrapper_inner(*args, **kwargs):
+            # Self is always passed first
+            slf = args[0]
+            key = (func.__name__, args[1:], tuple(sorted(kwargs.items())))
+            now = monotonic()
+            cached = slf._reply_cache.get(key)
+            if cached is not None and (ttl is None or now - cached[0] < ttl):
+                slf.logger.debug("%s()::returning cached value <%s>", func.__name__, cached[1])
+                return cached[1]
+            retval = func(*args, **kwargs)
+            slf._reply_cache[key] = (now, retval)
+            return retval
+        return wrapper_inner
+    return wrapper
+
+
 class LabDevice(AbstractLabDevice):
     """Base controller class for all labware devices.
     """
@@ -112,6 +138,16 @@ class LabDevice(AbstractLabDevice):
         self._lock = threading.RLock()
         # Pool of threads for keepalive/background tasks
         self._background_tasks: List[LabDeviceTask] = []
+        # Queue and worker thread serving send_async() calls
+        self._io_queue: queue.Queue = queue.Queue()
+        self._io_thread: Optional[threading.Thread] = None
+        # Guards swapping the I/O thread and queue only, never held during device I/O
+        self._io_thread_lock = threading.Lock()
+        # Values cached by the methods decorated with cached_reply()
+        self._reply_cache: Dict[Tuple, Tuple[float, Any]] = {}
+        # Callables dropping all device state cached on the host side, see invalidate_caches().
+        # Drivers keeping their own caches should register them here.
+        self._cache_invalidators: List[Callable] = [self.clear_cache]
 
         # Protocol settings
         self.command_prefix = ""
@@ -149,6 +185,51 @@ class LabDevice(AbstractLabDevice):
 
         self._simulation = bool(sim)
 
+    @property
+    def command_prefix(self) -> str:
+        """ Prefix added to every command sent to the device.
+        """
+
+        return self._command_prefix
+
+    @command_prefix.setter
+    def command_prefix(self, prefix: str):
+        """ Setter for the command prefix. Drops cached messages built with the old one.
+        """
+
+        self._command_prefix = prefix
+        self._message_cache: Dict[str, Tuple[str, str]] = {}
+
+    @property
+    def command_terminator(self) -> str:
+        """ Terminator added to every command sent to the device.
+        """
+
+        return self._command_terminator
+
+    @command_terminator.setter
+    def command_terminator(self, terminator: str):
+        """ Setter for the command terminator. Drops cached messages built with the old one.
+        """
+
+        self._command_terminator = terminator
+        self._message_cache = {}
+
+    @property
+    def args_delimiter(self) -> str:
+        """ Delimiter between the command and its parameter.
+        """
+
+        return self._args_delimiter
+
+    @args_delimiter.setter
+    def args_delimiter(self, delimiter: str):
+        """ Setter for the arguments delimiter. Drops cached messages built with the old one.
+        """
+
+        self._args_delimiter = delimiter
+        self._message_cache = {}
+
     def connect(self):
         """ Connects to the device.
 
@@ -162,14 +243,34 @@ class LabDevice(AbstractLabDevice):
             self.connection.open_connection()
         except (PLConnectionError, PLConnectionTimeoutError) as e:
             raise PLDeviceError(f"Can't connect to device <{self.__class__.__name__}.{self.device_name}>!") from e
+        # Device state might have changed while disconnected
+        self.invalidate_caches()
         self.logger.info("Opened connection.")
 
+    def reconnect(self):
+        """ Closes and re-opens the connection to the device, e.g. to recover
+        from a transient communication failure. Unlike
+        :py:meth:`disconnect()`, background tasks are kept running.
+
+        This method normally shouldn't be redefined in child classes.
+        """
+
+        if self._simulation is True:
+            self.logger.info("SIM :: Reopened connection.")
+            return
+        with self._lock:
+            if self.connection.is_connection_open():
+                self.connection.close_connection()
+            self.connect()
+
     def disconnect(self):
         """ Disconnects from the device.
 
         This method normally shouldn't be redefined in child classes.
         """
 
+        # Stop I/O thread if running
+        self._stop_io_thread()
         if self._simulation is True:
             self.logger.info("SIM :: Closed connection")
             return
@@ -180,6 +281,34 @@ class LabDevice(AbstractLabDevice):
         self.connection.close_connection()
         self.logger.info("Closed connection.")
 
+    def clear_cache(self, *methods: str):
+        """Drops the values cached by the methods decorated with
+        :py:func:`cached_reply()`.
+
+        Args:
+            methods: Names of the methods to drop cached values for.
+                     If none are given, the whole cache is cleared.
+        """
+
+        if not methods:
+            self._reply_cache.clear()
+            return
+        for key in list(self._reply_cache):
+            if key[0] in methods:
+                self._reply_cache.pop(key, None)
+
+    def invalidate_caches(self):
+        """Drops all device state cached on the host side - values cached by
+        :py:func:`cached_reply()` as well as any caches registered by the
+        driver in self._cache_invalidators. Has to be called whenever the
+        device state may have changed behind the driver's back, e.g. after
+        device reset or reconnection.
+        """
+
+        for invalidate in self._cache_invalidators:
+            invalidate()
+        self.logger.debug("invalidate_caches()::cached device state dropped.")
+
     def send(self, cmd, value=None):
         """This method takes the command to be sent and runs all necessary
         checks on the command parameter if present and required. Then the
@@ -213,6 +342,129 @@ class LabDevice(AbstractLabDevice):
             if reply_expected:
                 return self._recv(cmd)
 
+    def send_async(self, cmd, value=None) -> Future:
+        """This method queues the command for sending by the device I/O
+        thread and returns immediately without waiting for the reply. The I/O
+        thread is started on the first call and sends queued commands one by
+        one with :py:meth:`send()`, so callers running an event loop or GUI
+        are not blocked by the serial round-trip.
+
+        This method normally shouldn't be redefined in child classes.
+
+        Args:
+            cmd: The command to send.
+            value: Command parameter, if any.
+
+        Returns:
+            (Future): Future resolving to the value returned by :py:meth:`send()`.
+        """
+
+        with self._io_thread_lock:
+            if self._io_thread is None or not self._io_thread.is_alive():
+                self._io_thread = threading.Thread(target=self._io_worker, args=(self._io_queue,), name=f"{self.device_name}_io", daemon=True)
+                self._io_thread.start()
+            future: Future = Future()
+            self._io_queue.put((cmd, value, future))
+        return future
+
+    async def asend(self, cmd, value=None):
+        """Coroutine version of :py:meth:`send()` for use from asyncio code.
+        The command is passed to the device I/O thread with
+        :py:meth:`send_async()`, so the event loop keeps running while
+        waiting for the device reply. Calls overlapping a command in flight
+        are queued without blocking the loop, and several devices can be
+        driven from a single event loop this way.
+
+        This method normally shouldn't be redefined in child classes.
+
+        Args:
+            cmd: The command to send.
+            value: Command parameter, if any.
+
+        Returns:
+            (any): The value returned by :py:meth:`send()`.
+        """
+
+        return await asyncio.wrap_future(self.send_async(cmd, value))
+
+    def _io_worker(self, io_queue: queue.Queue):
+        """Sends the commands from the I/O queue and resolves the
+        corresponding futures. None in the queue signals the thread to exit.
+
+        Args:
+            io_queue: The queue this thread serves.
+        """
+
+        self.logger.info("I/O thread started.")
+        while True:
+            item = io_queue.get()
+            if item is None:
+                self.logger.info("I/O thread exiting.")
+                return
+            cmd, value, future = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(self.send(cmd, value))
+            except Exception as e:
+                future.set_exception(e)
+
+    def _stop_io_thread(self):
+        """Stops the I/O thread, if running, after it has sent all the
+        commands queued so far. The thread and its queue are detached under
+        the lock, so send_async() calls made meanwhile go to a new thread and
+        never wait for the queue to drain.
+        """
+
+        with self._io_thread_lock:
+            io_thread, io_queue = self._io_thread, self._io_queue
+            self._io_thread, self._io_queue = None, queue.Queue()
+        if io_thread is not None and io_thread.is_alive():
+            io_queue.put(None)
+            io_thread.join()
+
+    def send_many(self, cmds: List) -> List:
+        """This method sends a batch of commands to the device and reads back
+        the replies. All values are checked and all messages are prepared as in
+        :py:meth:`send()` before anything is sent, so an invalid value aborts
+        the whole batch. The commands are then sent one by one without
+        releasing the connection lock, so no other thread can interleave its
+        own commands with the batch.
+
+        Every command is transmitted separately and its reply is read back
+        before the next one is sent, so the connection command delay still
+        applies between the commands of a batch.
+
+        This method normally shouldn't be redefined in child classes.
+
+        Args:
+            cmds: List of commands to send. Each item is either a command
+                  definition or a (command, value) tuple.
+
+        Returns:
+            (List): Replies in the same order as the commands, None for the
+                    commands with no reply expected.
+        """
+
+        batch = []
+        for item in cmds:
+            cmd, value = item if isinstance(item, tuple) else (item, None)
+            if value is not None:
+                value = self.check_value(cmd, value)
+            batch.append((cmd, self.prepare_message(cmd, value)))
+
+        if self._simulation is True:
+            self.logger.info("SIM :: Pretending to send messages <%r>", [message for _, message in batch])
+            return [None] * len(batch)
+
+        replies = []
+        with self._lock:
+            for cmd, message in batch:
+                self.connection.transmit(message)
+                self.logger.debug("Sent message <%r>", message)
+                replies.append(self._recv(cmd) if cmd.get("reply", False) else None)
+        return replies
+
     def check_value(self, cmd: Dict, value: Any) -> Any:
         """ Checks the value provided against the definitions in command dict.
         Then does any value conversion/formatting/type casting as needed.
@@ -229,52 +481,48 @@ class LabDevice(AbstractLabDevice):
 
         # Value type casting
         # TODO think about moving type to check dictionary
-        if "type" in cmd.keys() and cmd["type"] is not None:
+        value_type = cmd.get("type")
+        if value_type is not None:
             try:
-                value = cmd["type"](value)
-                self.logger.debug("check_value()::type casted value <%s> to <%s>.", value, cmd["type"])
+                value = value_type(value)
+                self.logger.debug("check_value()::type casted value <%s> to <%s>.", value, value_type)
             # Invalid type definition
             except TypeError:
-                self.logger.error("check_value()::Illegal type <%s> specification in command <%s> definition.", cmd["type"], cmd["name"])
+                self.logger.error("check_value()::Illegal type <%s> specification in command <%s> definition.", value_type, cmd["name"])
             # Type cast error
             except ValueError:
-                raise PLDeviceCommandError(f"Can't cast value <{value}> to type <{cmd['type']}>.")
+                raise PLDeviceCommandError(f"Can't cast value <{value}> to type <{value_type}>.")
         else:
             self.logger.debug("check_value()::type casting not required - skipped.")
 
         # Check if any checking/processing is required acc. to cmd definition
-        check_needed = cmd.get("check", False)
-        if check_needed is False:
+        check = cmd.get("check")
+        if not check:
             return value
 
-        # Value checking
-        if "check" in cmd.keys() and cmd["check"] is not None:
-
-            # Min/max check
-            try:
-                if value < cmd["check"]["min"]:
-                    raise PLDeviceCommandError(f"Requested value <{value}> is below limit <{cmd['check']['min']}> !")
-                self.logger.debug("check_value()::min check <%s> < <%s>", value, cmd['check']['min'])
-                if value > cmd["check"]["max"]:
-                    raise PLDeviceCommandError(f"Requested value <{value}> is above limit <{cmd['check']['max']}> !")
-                self.logger.debug("check_value()::max check <%s> > <%s>", value, cmd['check']['max'])
-            # No cmd["check"]["min"] or cmd["check"]["max"]
-            except KeyError:
-                self.logger.debug("check_value()::min/max check not required - skipped.")
-            # Invalid value in cmd["check"]["min"] or cmd["check"]["max"]
-            except TypeError:
-                self.logger.error("Illegal min/max values specification in command <%s> definition!", cmd["name"])
+        # Min/max check
+        minimum = check.get("min")
+        maximum = check.get("max")
+        try:
+            if minimum is not None and value < minimum:
+                raise PLDeviceCommandError(f"Requested value <{value}> is below limit <{minimum}> !")
+            if maximum is not None and value > maximum:
+                raise PLDeviceCommandError(f"Requested value <{value}> is above limit <{maximum}> !")
+            self.logger.debug("check_value()::min/max check <%s> <= <%s> <= <%s>", minimum, value, maximum)
+        # Invalid value in cmd["check"]["min"] or cmd["check"]["max"]
+        except TypeError:
+            self.logger.error("Illegal min/max values specification in command <%s> definition!", cmd["name"])
 
-            # Value in range check
-            try:
-                if value not in cmd["check"]["values"]:
-                    raise PLDeviceCommandError(f"Requested value <{value}> not in the allowed range <{cmd['check']['values']}>.")
-                self.logger.debug("check_value()::range check <%s> in range <%s>", value, cmd["check"]["values"])
-            # No cmd["check"]["range"]
-            except KeyError:
-                self.logger.debug("check_value()::range check not required - skipped.")
-            except TypeError:
-                self.logger.error("Illegal range specification in command <%s> definition.", cmd["name"])
+        # Value in range check
+        allowed_values = check.get("values")
+        if allowed_values is None:
+            return value
+        try:
+            if value not in allowed_values:
+                raise PLDeviceCommandError(f"Requested value <{value}> not in the allowed range <{allowed_values}>.")
+            self.logger.debug("check_value()::range check <%s> in range <%s>", value, allowed_values)
+        except TypeError:
+            self.logger.error("Illegal range specification in command <%s> definition.", cmd["name"])
         return value
 
     def prepare_message(self, cmd: Dict, value: Any) -> str:
@@ -292,10 +540,17 @@ class LabDevice(AbstractLabDevice):
             (str): Checked & prepared command string.
         """
 
+        # Build the constant parts of the message once - complete message
+        # without parameters and message head to append the parameter to
+        cached = self._message_cache.get(cmd["name"])
+        if cached is None:
+            head = self.command_prefix + cmd["name"]
+            cached = (head + self.command_terminator, head + self.args_delimiter)
+            self._message_cache[cmd["name"]] = cached
         if value is None:
-            return self.command_prefix + cmd["name"] + self.command_terminator
+            return cached[0]
         # Else
-        return self.command_prefix + cmd["name"] + self.args_delimiter + str(value) + self.command_terminator
+        return cached[1] + str(value) + self.command_terminator
 
     def _recv(self, cmd: Dict) -> Union[int, float, str, bool]:
         """Locks the connection object, reads back the reply and re-assembles it
@@ -327,9 +582,22 @@ class LabDevice(AbstractLabDevice):
                 else:
                     self.logger.warning("Received chunked reply, but reply terminator is not set - reassembly not possible!")
         self.logger.debug("Raw reply from the device: <%r>", reply.body)
+        return self._process_reply(cmd, reply)
+
+    def _process_reply(self, cmd: Dict, reply: Any) -> Any:
+        """Runs parsing and type casting on the raw reply according to command
+        definition.
+
+        Args:
+            cmd: Command definition.
+            reply: Raw reply from the device.
+
+        Returns:
+            (any): Processed reply.
+        """
 
         # Usually, we don't expect empty replies when we are waiting for them
-        if reply.body == "":
+        if getattr(reply, "body", reply) == "":
             self.logger.warning("Empty reply from device!")
 
         # Run parsing
@@ -370,20 +638,21 @@ class LabDevice(AbstractLabDevice):
         reply = parser.stripper(reply, self.reply_prefix, self.reply_terminator)
 
         # Get parser function
-        try:
-            function = cmd["reply"]["parser"]
-            # Then get parser function arguments
-            args = cmd["reply"].get("args", [])
-            self.logger.debug("parse_reply()::got parser <%s>, arguments <%s>", function, args)
-            # Run parsing
-            if callable(function):
-                reply = function(reply, *args)
-                self.logger.debug("parse_reply()::parsed reply <%s>", reply)
-            else:
-                self.logger.error("Parsing function <%s> defined for command <%s> is not callable!", function, cmd["name"])
-        except KeyError:
+        reply_definition = cmd.get("reply") or {}
+        function = reply_definition.get("parser")
+        if function is None:
             # No parser found in command definition
             self.logger.debug("parse_reply()::parsing not defined for command <%s> - skipped.", cmd["name"])
+            return reply
+        # Then get parser function arguments
+        args = reply_definition.get("args", [])
+        self.logger.debug("parse_reply()::got parser <%s>, arguments <%s>", function, args)
+        # Run parsing
+        if callable(function):
+            reply = function(reply, *args)
+            self.logger.debug("parse_reply()::parsed reply <%s>", reply)
+        else:
+            self.logger.error("Parsing function <%s> defined for command <%s> is not callable!", function, cmd["name"])
 
         return reply
 
@@ -398,29 +667,30 @@ class LabDevice(AbstractLabDevice):
             (any): Reply casted to the correct type.
         """
 
+        reply_type = (cmd.get("reply") or {}).get("type")
+        if reply_type is None:
+            # No cmd["reply"]["type"] node found
+            self.logger.debug("cast_reply_type()::no type definition found - skipped.")
+            return reply
         try:
             # Special case - "0" string should be casted to boolean False
-            if reply == "0" and cmd["reply"]["type"] is bool:
+            if reply == "0" and reply_type is bool:
                 casted_reply = False
             # Special case - returned value is a string representing float (e.g.
             # "0.0") and we need to cast it to int. int("0.0") would give a
             # ValueError, so we need to convert it to float first
-            if cmd["reply"]["type"] is int:
+            elif reply_type is int:
                 casted_reply = int(float(reply))
             else:
-                casted_reply = cmd["reply"]["type"](reply)
-            self.logger.debug("cast_reply_type()::casted reply type to %s.", cmd['reply']['type'])
-        # No cmd["reply"]["type"] node found
-        except KeyError:
-            self.logger.debug("cast_reply_type()::no type definition found - skipped.")
-            return reply
+                casted_reply = reply_type(reply)
+            self.logger.debug("cast_reply_type()::casted reply type to %s.", reply_type)
         # cmd["reply"]["type"] does not point to a proper data type
         except TypeError:
-            self.logger.error("Illegal parse type <%s> specification in command <%s> definition.", cmd["reply"]["type"], cmd["name"])
+            self.logger.error("Illegal parse type <%s> specification in command <%s> definition.", reply_type, cmd["name"])
             return reply
         # Type casting error
         except ValueError:
-            raise PLDeviceReplyError(f"Can't cast reply <{reply}> to type <{cmd['reply']['type']}>.")
+            raise PLDeviceReplyError(f"Can't cast reply <{reply}> to type <{reply_type}>.")
         else:
             return casted_reply
 
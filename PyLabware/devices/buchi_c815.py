@@ -221,7 +221,7 @@ class C815FlashChromatographySystem(AbstractFlashChromatographySystem):
         """ Checks whether the device is idle
         """
 
-        return self.get_runningstate == self.cmd.C815_IDLE_STATE
+        return self.get_runningstate() == self.cmd.C815_IDLE_STATE
 
     def check_errors(self) -> None:
         """ Not supported on this model
@@ -29,27 +29,33 @@ class HeiTorque100PrecisionStirrerCommands(LabDeviceCommands):
     # Default name for the HT 100 Precision model replied to T command
     DEFAULT_NAME = "HT:100P"
 
+    # Reply parsing patterns
+    STATUS_PATTERN = re.compile(r'FLT:\s(.*!)')
+    SPEED_SET_PATTERN = re.compile(r'SET:\s(\d{1,4})')
+    SPEED_PATTERN = re.compile(r'RPM:\s(\d{1,4})')
+    TORQUE_PATTERN = re.compile(r'NCM:\s(-*?\d{1,4})')
+
     # ################### Control commands ###################################
     # Clear OVERLOAD error
     CLEAR_ERROR = {"name": "C", "reply": {"type": str}}
     # Get status/error message
-    GET_STATUS = {"name": "f", "reply": {"type": str, "parser": parser.researcher, "args": [r'FLT:\s(.*!)']}}
+    GET_STATUS = {"name": "f", "reply": {"type": str, "parser": parser.researcher, "args": [STATUS_PATTERN]}}
     # Identify the instrument (Flash the device display)
     IDENTIFY = {"name": "M", "reply": {"type": str}}
     # Get stirrer name
     GET_NAME = {"name": "T", "reply": {"type": str}}
     # Stop stirrer
-    STOP = {"name": "R0000", "reply": {"type": int, "parser": parser.researcher, "args": [r'SET:\s(\d{1,4})']}}
+    STOP = {"name": "R0000", "reply": {"type": int, "parser": parser.researcher, "args": [SPEED_SET_PATTERN]}}
     # Set rotation speed (rpm)
     SET_SPEED = {"name": "R", "type": int, "check": {"min": 10, "max": 2000},
-                 "reply": {"type": int, "parser": parser.researcher, "args": [r'SET:\s(\d{1,4})']}}
+                 "reply": {"type": int, "parser": parser.researcher, "args": [SPEED_SET_PATTERN]}}
     # Get rotation speed setpoint
-    GET_SPEED_SET = {"name": "s", "reply": {"type": int, "parser": parser.researcher, "args": [r'SET:\s(\d{1,4})']}}
+    GET_SPEED_SET = {"name": "s", "reply": {"type": int, "parser": parser.researcher, "args": [SPEED_SET_PATTERN]}}
     # Get actual rotation speed
-    GET_SPEED = {"name": "r", "reply": {"type": int, "parser": parser.researcher, "args": [r'RPM:\s(\d{1,4})']}}
+    GET_SPEED = {"name": "r", "reply": {"type": int, "parser": parser.researcher, "args": [SPEED_PATTERN]}}
 
     # Get torque (in Newton millimeter - Nmm)
-    GET_TORQUE = {"name": "m", "reply": {"type": int, "parser": parser.researcher, "args": [r'NCM:\s(-*?\d{1,4})']}}
+    GET_TORQUE = {"name": "m", "reply": {"type": int, "parser": parser.researcher, "args": [TORQUE_PATTERN]}}
     # Switch remote control off; motor speed is controlled by knob position.
     # WARNING! If this command is issued while the stirrer is rotating, it reads
     # out actual knob position & applies according speed, it wouldn't stop!
@@ -24,23 +24,29 @@ class RZR2052ControlStirrerCommands(LabDeviceCommands):
     MOTOR_ERROR = "Motor Error!"
     OVERHEAT_ERROR = "Motor Temperature!"
 
+    # Reply parsing patterns
+    STATUS_PATTERN = re.compile(r'FLT:\s(.*!)')
+    SPEED_SET_PATTERN = re.compile(r'SET:\s(\d{1,4})')
+    SPEED_PATTERN = re.compile(r'RPM:\s(\d{1,4})')
+    TORQUE_PATTERN = re.compile(r'NCM:\s(-*?\d{1,4})')
+
     # ################### Control commands ###################################
     # Clear error & restart the motor
     RESET = {"name": "C", "reply": {"type": str}}
     # Get status/error message
-    GET_STATUS = {"name": "f", "reply": {"type": str, "parser": parser.researcher, "args": [r'FLT:\s(.*!)']}}
+    GET_STATUS = {"name": "f", "reply": {"type": str, "parser": parser.researcher, "args": [STATUS_PATTERN]}}
     # Stop stirrer
-    STOP = {"name": "R0", "reply": {"type": int, "parser": parser.researcher, "args": [r'SET:\s(\d{1,4})']}}
+    STOP = {"name": "R0", "reply": {"type": int, "parser": parser.researcher, "args": [SPEED_SET_PATTERN]}}
     # Set rotation speed & start stirrer
     SET_SPEED = {"name": "R", "type": int, "check": {"min": 50, "max": 2000},
-                 "reply": {"type": int, "parser": parser.researcher, "args": [r'SET:\s(\d{1,4})']}}
+                 "reply": {"type": int, "parser": parser.researcher, "args": [SPEED_SET_PATTERN]}}
     # Get rotation speed setpoint
-    GET_SPEED_SET = {"name": "s", "reply": {"type": int, "parser": parser.researcher, "args": [r'SET:\s(\d{1,4})']}}
+    GET_SPEED_SET = {"name": "s", "reply": {"type": int, "parser": parser.researcher, "args": [SPEED_SET_PATTERN]}}
     # Get actual rotation speed
-    GET_SPEED = {"name": "r", "reply": {"type": int, "parser": parser.researcher, "args": [r'RPM:\s(\d{1,4})']}}
+    GET_SPEED = {"name": "r", "reply": {"type": int, "parser": parser.researcher, "args": [SPEED_PATTERN]}}
 
     # Get torque
-    GET_TORQUE = {"name": "m", "reply": {"type": int, "parser": parser.researcher, "args": [r'NCM:\s(-*?\d{1,4})']}}
+    GET_TORQUE = {"name": "m", "reply": {"type": int, "parser": parser.researcher, "args": [TORQUE_PATTERN]}}
     # Switch remote control off; motor speed is controlled by knob position.
     # Warning! If this command is issued while the stirrer is rotating, it reads out actual knob position & applies according speed, it wouldn't stop!
     SET_RMT_OFF = {"name": "D"}
@@ -106,14 +106,14 @@ class PetiteFleurChiller(AbstractTemperatureController):
         """
 
     def is_connected(self) -> bool:
-        """Tries to get chiller status & compares it to the template value.
+        """Tries to get chiller status & checks that it is a valid status word.
         """
 
         try:
-            status = self.get_status()
-        except PLConnectionError:
+            self.get_status_code()
+        except (PLConnectionError, ValueError):
             return False
-        return len(status) == len(self.cmd.STATUSES)
+        return True
 
     def is_idle(self) -> bool:
         """Checks whether the chiller is running.
@@ -262,33 +262,38 @@ class PetiteFleurChiller(AbstractTemperatureController):
         choice = int(choice, base=16)
         return choice
 
-    def get_status(self) -> str:
-        """Returns the status of the chiller.
+    def get_status_code(self) -> int:
+        """Returns the raw status word of the chiller.
         """
 
         s = self.send(self.cmd.GET_STATUS)
-        return '{:015b}'.format(int(s, 16) & 0b111111111111111)
+        return int(s, 16) & 0b111111111111111
+
+    def get_status(self) -> str:
+        """Returns the status of the chiller as a string of status bits.
+        """
+
+        return '{:015b}'.format(self.get_status_code())
 
     def interpret_status(self, status_string: str) -> str:
         """Interprets the status string to return human-readable status
         """
 
         ret = ""
-        ans = {'0': 'INACTIVE', '1': 'ACTIVE'}
-        p7 = {'0': 'Expert Mode', '1': 'Automatic Mode'}
-        p13 = {'1': 'No Failure', '0': 'System restarted'}
-        p5_8_9 = {'0': 'NO', '1': 'YES'}
-        count = 0
-        for i in status_string:
+        # Labels indexed by the status bit value
+        ans = ('INACTIVE', 'ACTIVE')
+        p7 = ('Expert Mode', 'Automatic Mode')
+        p13 = ('System restarted', 'No Failure')
+        p5_8_9 = ('NO', 'YES')
+        for count, bit in enumerate(map(int, status_string)):
             if count == 7:
-                ret += self.cmd.STATUSES[count] + p7[i] + "\n"
+                ret += self.cmd.STATUSES[count] + p7[bit] + "\n"
             elif count in (5, 8, 9):
-                ret += self.cmd.STATUSES[count] + p5_8_9[i] + "\n"
+                ret += self.cmd.STATUSES[count] + p5_8_9[bit] + "\n"
             elif count == 13:
-                ret += self.cmd.STATUSES[count] + p13[i] + "\n"
+                ret += self.cmd.STATUSES[count] + p13[bit] + "\n"
             else:
-                ret += self.cmd.STATUSES[count] + ans[i] + "\n"
-            count += 1
+                ret += self.cmd.STATUSES[count] + ans[bit] + "\n"
         return ret
 
     def get_pump_pressure(self) -> int:
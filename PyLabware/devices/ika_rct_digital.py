@@ -1,11 +1,11 @@
 """PyLabware driver for IKA RCT Digital stirring hotplate."""
 
-from typing import Optional, Union
+from typing import Dict, Optional, Union
 import serial
 
 # Core imports
 from .. import parsers as parser
-from ..controllers import AbstractHotplate, in_simulation_device_returns
+from ..controllers import AbstractHotplate, cached_reply, in_simulation_device_returns
 from ..exceptions import PLConnectionError, PLDeviceCommandError
 from ..models import LabDeviceCommands, ConnectionParameters
 
@@ -49,6 +49,9 @@ class RCTDigitalHotplateCommands(LabDeviceCommands):
     # Stop the stirrer
     STOP_STIR = {"name": "STOP_4"}
 
+    # Temperature readout commands for each sensor
+    GET_TEMP_BY_SENSOR = {0: GET_TEMP, 1: GET_TEMP_EXT}
+
     # ################### Configuration commands #############################
     # Set device operation mode A (normal)
     SET_MODE_A = {"name": "SET_MODE_A"}
@@ -81,6 +84,8 @@ class RCTDigitalHotplate(AbstractHotplate):
         connection_parameters["baudrate"] = 9600
         connection_parameters["bytesize"] = serial.SEVENBITS
         connection_parameters["parity"] = serial.PARITY_EVEN
+        connection_parameters["low_latency"] = True
+        connection_parameters["driver_buffer_size"] = 65536
 
         super().__init__(device_name, connection_mode, connection_parameters)
 
@@ -92,6 +97,9 @@ class RCTDigitalHotplate(AbstractHotplate):
         # This device has no command to check status
         self._heating = False
         self._stirring = False
+        # Last setpoints sent to the device, to skip sending unchanged values
+        self._last_setpoints = {}
+        self._cache_invalidators.append(self._last_setpoints.clear)
 
     def initialize_device(self):
         """Set default operation mode & reset.
@@ -99,6 +107,7 @@ class RCTDigitalHotplate(AbstractHotplate):
 
         self.send(self.cmd.SET_MODE_A)
         self.send(self.cmd.RESET)
+        self.invalidate_caches()
         self.logger.info("Device initialized.")
 
     @in_simulation_device_returns(RCTDigitalHotplateCommands.DEFAULT_NAME)
@@ -145,6 +154,7 @@ class RCTDigitalHotplate(AbstractHotplate):
 
         self.send(self.cmd.STOP_HEAT)
         self._heating = False
+        self._last_setpoints.pop("temperature", None)
 
     def start_stirring(self):
         """Starts stirring.
@@ -159,7 +169,9 @@ class RCTDigitalHotplate(AbstractHotplate):
 
         self.send(self.cmd.STOP_STIR)
         self._stirring = False
+        self._last_setpoints.pop("speed", None)
 
+    @cached_reply(ttl=0.2)
     def get_temperature(self, sensor: int = 0) -> float:
         """Gets the actual temperature.
 
@@ -167,12 +179,9 @@ class RCTDigitalHotplate(AbstractHotplate):
             sensor (int): Specify which temperature probe to read.
         """
 
-        if sensor == 0:
-            return self.send(self.cmd.GET_TEMP)
-        elif sensor == 1:
-            return self.send(self.cmd.GET_TEMP_EXT)
-        else:
+        if sensor not in self.cmd.GET_TEMP_BY_SENSOR:
             raise PLDeviceCommandError(f"Invalid sensor provided! Allowed values are: {self.cmd.TEMP_SENSORS}")
+        return self.send(self.cmd.GET_TEMP_BY_SENSOR[sensor])
 
     def get_temperature_setpoint(self, sensor: int = 0) -> float:
         """Reads the current temperature setpoint.
@@ -195,8 +204,14 @@ class RCTDigitalHotplate(AbstractHotplate):
                           Hence, this argument has no effect here.
         """
 
+        temperature = self.check_value(self.cmd.SET_TEMP, temperature)
+        if self._last_setpoints.get("temperature") == temperature:
+            self.logger.debug("set_temperature()::temperature setpoint <%s> unchanged - skipped.", temperature)
+            return
         self.send(self.cmd.SET_TEMP, temperature)
+        self._last_setpoints["temperature"] = temperature
 
+    @cached_reply(ttl=0.2)
     def get_speed(self) -> int:
         """Gets the actual stirring speed.
         """
@@ -213,10 +228,31 @@ class RCTDigitalHotplate(AbstractHotplate):
         """Sets desired speed.
         """
 
+        speed = self.check_value(self.cmd.SET_SPEED, speed)
+        if self._last_setpoints.get("speed") == speed:
+            self.logger.debug("set_speed()::speed setpoint <%s> unchanged - skipped.", speed)
+            return
         self.send(self.cmd.SET_SPEED, speed)
+        self._last_setpoints["speed"] = speed
 
     def get_viscosity_trend(self) -> float:
         """Gets current viscosity rend.
         """
 
         return self.send(self.cmd.GET_VISC)
+
+    def poll_all(self) -> Dict[str, float]:
+        """Reads back all process values and setpoints in a single batch,
+        without other commands interleaving. Handy for periodic status refresh
+        when several values are needed at once.
+        """
+
+        values = {
+            "temperature": self.cmd.GET_TEMP,
+            "temperature_ext": self.cmd.GET_TEMP_EXT,
+            "temperature_setpoint": self.cmd.GET_TEMP_SET,
+            "speed": self.cmd.GET_SPEED,
+            "speed_setpoint": self.cmd.GET_SPEED_SET,
+            "viscosity_trend": self.cmd.GET_VISC,
+        }
+        return dict(zip(values, self.send_many(list(values.values()))))
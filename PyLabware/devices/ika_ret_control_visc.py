@@ -5,7 +5,7 @@ import serial
 
 # Core imports
 from .. import parsers as parser
-from ..controllers import AbstractHotplate, in_simulation_device_returns
+from ..controllers import AbstractHotplate, cached_reply, in_simulation_device_returns
 from ..exceptions import PLConnectionError, PLDeviceCommandError
 from ..models import LabDeviceCommands, ConnectionParameters
 
@@ -69,6 +69,11 @@ class RETControlViscHotplateCommands(LabDeviceCommands):
     # Stop the stirrer
     STOP_STIR = {"name": "STOP_4"}
 
+    # Temperature readout, setpoint readout and setpoint commands for each sensor
+    GET_TEMP_BY_SENSOR = {0: GET_TEMP, 1: GET_TEMP_EXT, 2: GET_TEMP_EXT_2}
+    GET_TEMP_SET_BY_SENSOR = {0: GET_TEMP_SET, 1: GET_TEMP_EXT_SET, 2: GET_TEMP_EXT_2_SET}
+    SET_TEMP_BY_SENSOR = {0: SET_TEMP, 1: SET_TEMP_EXT, 2: SET_TEMP_EXT_2}
+
     # ################### Configuration commands #############################
     # Get firmware version
     GET_VERSION = {"name": "IN_VERSION", "reply": {"type": str}}
@@ -121,6 +126,8 @@ class RETControlViscHotplate(AbstractHotplate):
         connection_parameters["baudrate"] = 9600
         connection_parameters["bytesize"] = serial.SEVENBITS
         connection_parameters["parity"] = serial.PARITY_EVEN
+        connection_parameters["low_latency"] = True
+        connection_parameters["driver_buffer_size"] = 65536
 
         super().__init__(device_name, connection_mode, connection_parameters)
 
@@ -132,12 +139,18 @@ class RETControlViscHotplate(AbstractHotplate):
         # This device has no command to check status
         self._heating = False
         self._stirring = False
+        # Last setpoints sent to the device, to skip sending unchanged values
+        self._last_setpoints = {}
+        self._cache_invalidators.append(self._last_setpoints.clear)
+        # The watchdog changes the setpoints on its own, so none are skipped while it is armed
+        self._watchdog_armed = False
 
     def initialize_device(self):
         """Resets the device.
         """
 
         self.send(self.cmd.RESET)
+        self.invalidate_caches()
 
     @in_simulation_device_returns(RETControlViscHotplateCommands.DEFAULT_NAME)
     def is_connected(self) -> bool:
@@ -152,7 +165,7 @@ class RETControlViscHotplate(AbstractHotplate):
         if reply == self.cmd.DEFAULT_NAME:
             return True
         # Check if the stirplate is likely to be an IKA RET Control Visc (based on firmware version) and rename it
-        elif self.send(self.cmd.GET_VERSION)[0:3] == "110":
+        elif self.get_version()[0:3] == "110":
             self.logger.warning("is_connected()::An IKA RET hotplate with non-standard name has been detected."
                                 "Ensure that the right device is connected!"
                                 "The name will be now reset to default %s", self.cmd.DEFAULT_NAME)
@@ -170,6 +183,13 @@ class RETControlViscHotplate(AbstractHotplate):
             return False
         return not (self._heating or self._stirring)
 
+    @cached_reply()
+    def get_version(self) -> str:
+        """Gets firmware version.
+        """
+
+        return self.send(self.cmd.GET_VERSION)
+
     def get_status(self):
         """Not supported on this device.
         """
@@ -195,6 +215,8 @@ class RETControlViscHotplate(AbstractHotplate):
 
         self.send(self.cmd.STOP_HEAT)
         self._heating = False
+        for sensor in self.cmd.TEMP_SENSORS:
+            self._last_setpoints.pop(("temperature", sensor), None)
 
     def start_stirring(self):
         """Starts stirring.
@@ -209,7 +231,9 @@ class RETControlViscHotplate(AbstractHotplate):
 
         self.send(self.cmd.STOP_STIR)
         self._stirring = False
+        self._last_setpoints.pop("speed", None)
 
+    @cached_reply(ttl=0.2)
     def get_temperature(self, sensor: int = 0) -> float:
         """Gets the actual temperature.
 
@@ -217,14 +241,9 @@ class RETControlViscHotplate(AbstractHotplate):
             sensor (int): Specify which temperature probe to read.
         """
 
-        if sensor == 0:
-            return self.send(self.cmd.GET_TEMP)
-        elif sensor == 1:
-            return self.send(self.cmd.GET_TEMP_EXT)
-        elif sensor == 2:
-            return self.send(self.cmd.GET_TEMP_EXT_2)
-        else:
+        if sensor not in self.cmd.GET_TEMP_BY_SENSOR:
             raise PLDeviceCommandError(f"Invalid sensor provided! Allowed values are: {self.cmd.TEMP_SENSORS}")
+        return self.send(self.cmd.GET_TEMP_BY_SENSOR[sensor])
 
     def get_temperature_setpoint(self, sensor: int = 0) -> float:
         """Gets desired temperature setpoint.
@@ -233,14 +252,9 @@ class RETControlViscHotplate(AbstractHotplate):
             sensor (int): Specify which temperature setpoint to read.
         """
 
-        if sensor == 0:
-            return self.send(self.cmd.GET_TEMP_SET)
-        elif sensor == 1:
-            return self.send(self.cmd.GET_TEMP_EXT_SET)
-        elif sensor == 2:
-            return self.send(self.cmd.GET_TEMP_EXT_2_SET)
-        else:
+        if sensor not in self.cmd.GET_TEMP_SET_BY_SENSOR:
             raise PLDeviceCommandError(f"Invalid sensor provided! Allowed values are: {self.cmd.TEMP_SENSORS}")
+        return self.send(self.cmd.GET_TEMP_SET_BY_SENSOR[sensor])
 
     def get_safety_temperature(self) -> float:
         """Gets safety temperature sensor reading.
@@ -261,15 +275,17 @@ class RETControlViscHotplate(AbstractHotplate):
             sensor (int): Specify which temperature probe the setpoint applies to.
         """
 
-        if sensor == 0:
-            self.send(self.cmd.SET_TEMP, temperature)
-        elif sensor == 1:
-            self.send(self.cmd.SET_TEMP_EXT, temperature)
-        elif sensor == 2:
-            self.send(self.cmd.SET_TEMP_EXT_2, temperature)
-        else:
+        if sensor not in self.cmd.SET_TEMP_BY_SENSOR:
             raise PLDeviceCommandError(f"Invalid sensor provided! Allowed values are: {self.cmd.TEMP_SENSORS}")
-
+        cmd = self.cmd.SET_TEMP_BY_SENSOR[sensor]
+        temperature = self.check_value(cmd, temperature)
+        if not self._watchdog_armed and self._last_setpoints.get(("temperature", sensor)) == temperature:
+            self.logger.debug("set_temperature()::temperature setpoint <%s> unchanged - skipped.", temperature)
+            return
+        self.send(cmd, temperature)
+        self._last_setpoints[("temperature", sensor)] = temperature
+
+    @cached_reply(ttl=0.2)
     def get_speed(self) -> int:
         """Gets current stirring speed.
         """
@@ -286,7 +302,12 @@ class RETControlViscHotplate(AbstractHotplate):
         """Sets the stirring speed.
         """
 
+        speed = self.check_value(self.cmd.SET_SPEED, speed)
+        if not self._watchdog_armed and self._last_setpoints.get("speed") == speed:
+            self.logger.debug("set_speed()::speed setpoint <%s> unchanged - skipped.", speed)
+            return
         self.send(self.cmd.SET_SPEED, speed)
+        self._last_setpoints["speed"] = speed
 
     def get_viscosity_trend(self) -> float:
         """Gets current viscosity value.
@@ -311,6 +332,8 @@ class RETControlViscHotplate(AbstractHotplate):
         """
 
         self.send(self.cmd.SET_WD_MODE_1, timeout)
+        self._watchdog_armed = True
+        self.invalidate_caches()
 
     def setup_watchdog_mode2(self, temperature: int, speed: int):
         """This can be cleared remotely
@@ -320,12 +343,15 @@ class RETControlViscHotplate(AbstractHotplate):
         self.send(self.cmd.SET_WD_SAFE_TEMP, temperature)
         # Set failsafe speed
         self.send(self.cmd.SET_WD_SAFE_SPEED, speed)
+        self.invalidate_caches()
 
     def start_watchdog_mode2(self, timeout: int):
         """This doesn't display any error as advertised in the manual, just falls back to safety values
         """
 
         self.send(self.cmd.SET_WD_MODE_2, timeout)
+        self._watchdog_armed = True
+        self.invalidate_caches()
 
     def stop_watchdog(self):
         """Clears mode2 watchdog.
@@ -333,3 +359,5 @@ class RETControlViscHotplate(AbstractHotplate):
 
         self.send(self.cmd.SET_WD_MODE_1, 0)
         self.send(self.cmd.SET_WD_MODE_2, 0)
+        self._watchdog_armed = False
+        self.invalidate_caches()
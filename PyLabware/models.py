@@ -12,10 +12,12 @@ class ConnectionParameters(TypedDict, total=False):
     baudrate: int
     bytesize: int
     command_delay: float
+    driver_buffer_size: Optional[int]
     dsrdtr: bool
     encoding: str
     headers: str
     inter_byte_timeout: float
+    low_latency: bool
     parity: str
     password: str
     port: Union[int, str]
@@ -23,6 +25,7 @@ class ConnectionParameters(TypedDict, total=False):
     receiving_interval: float
     receive_timeout: float
     receive_buffer_size: int
+    receive_settle_time: float
     rtscts: bool
     schema: str
     stopbits: float
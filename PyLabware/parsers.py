@@ -23,12 +23,17 @@ def researcher(reply, *args):
 
     Args:
         reply: Reply to parse with regular expression.
+        args: Regular expression pattern, either a string or precompiled.
 
     Returns:
         (re.Match): Regular expression match object.
     """
 
-    return re.search(*args, reply)
+    pattern = args[0]
+    # Precompiled patterns skip the re module pattern cache lookup
+    if isinstance(pattern, re.Pattern):
+        return pattern.search(reply)
+    return re.search(pattern, reply)
 
 
 def stripper(reply: str, prefix=None, suffix=None) -> str: